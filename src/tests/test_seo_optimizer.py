@@ -264,6 +264,31 @@ def test_recommendations():
         print(f"\n❌ TEST FAILED: {str(e)}")
         return False
 
+def test_empty_header_line():
+    """Test that a bare '###' line does not swallow the header below it"""
+    print("\n" + "="*70)
+    print("TEST 6: Empty Header Line")
+    print("="*70)
+    
+    content = "###\n## Real H2\n\n" + GOOD_SEO_CONTENT.split("## What is Machine Learning?")[1]
+    
+    try:
+        result = seo_optimizer._run(content=content)
+        
+        if 'H2 Headers: 4' in result:
+            print("\n✅ Header on the line after '###' counted as H2")
+            print("\n" + "="*70)
+            print("✅ TEST PASSED - Header parsing stays on one line")
+            print("="*70)
+            return True
+        else:
+            print("\n❌ Wrong H2 count for content after an empty header line")
+            return False
+            
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        return False
+
 def main():
     """Run all SEO optimizer tests"""
     print("\n" + "="*70)
@@ -275,7 +300,8 @@ def main():
         ("Keyword Analysis", test_keyword_analysis),
         ("Error Handling", test_error_handling),
         ("SEO Score Calculation", test_seo_score_calculation),
-        ("Recommendations", test_recommendations)
+        ("Recommendations", test_recommendations),
+        ("Empty Header Line", test_empty_header_line)
     ]
     
     results = {}
@@ -4,10 +4,55 @@ Wikipedia + DuckDuckGo with fallback strategies
 """
 
 from crewai.tools import tool
-import wikipedia
+import requests
+from requests.adapters import HTTPAdapter
 from ddgs import DDGS
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import wraps
+from pathlib import Path
+from utils.file_io import write_json_atomic
+import hashlib
+import json
+import os
+import re
+import threading
 import time
 
+# Upper bound (seconds) on how long a search waits for its sources
+SEARCH_TIMEOUT = 30
+
+# Socket timeout (seconds) for each Wikipedia / DuckDuckGo request
+REQUEST_TIMEOUT = 10
+
+# DuckDuckGo retries, stopped early once another attempt would overrun
+# SEARCH_TIMEOUT so a worker never outlives the caller's wait for long
+DDG_ATTEMPTS = 3
+DDG_RETRY_DELAY = 1
+
+# Shared pool so Wikipedia and DuckDuckGo are queried side by side; two
+# workers per search, so several agents can research at once without
+# queueing behind each other
+RESEARCH_WORKERS = 8
+_executor = ThreadPoolExecutor(max_workers=RESEARCH_WORKERS, thread_name_prefix="research")
+
+# One DDGS client per worker thread, reused across searches
+_thread_local = threading.local()
+
+# Wikipedia is queried through the MediaWiki API on a shared session, so
+# every request carries REQUEST_TIMEOUT and connections are kept alive
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+_session = requests.Session()
+_session.headers.update({'User-Agent': 'content-creation-research-tool/1.0'})
+_session.mount('https://', HTTPAdapter(pool_maxsize=RESEARCH_WORKERS))
+
+# On-disk response cache shared by every agent/process using this tool,
+# anchored at the project root so runs from any directory share it
+CACHE_DIR = Path(__file__).resolve().parents[2] / "cache" / "research"
+CACHE_TTL = int(os.getenv("RESEARCH_CACHE_TTL", str(24 * 60 * 60)))
+# Expired entries are swept from CACHE_DIR at most this often (seconds)
+CACHE_PRUNE_INTERVAL = 60 * 60
+_last_prune = 0.0
+
 
 @tool("Free Research Tool")
 def research_tool(query: str, max_results: int = 5) -> str:
@@ -17,21 +62,33 @@ def research_tool(query: str, max_results: int = 5) -> str:
     results = []
     errors = []
     
+    # Query Wikipedia and DuckDuckGo concurrently under one deadline;
+    # whatever has not started by then is dropped
+    wiki_future = _executor.submit(_search_wikipedia, query)
+    ddg_future = _executor.submit(_search_duckduckgo_with_retry, query, max_results)
+    done, pending = wait((wiki_future, ddg_future), timeout=SEARCH_TIMEOUT)
+    for future in pending:
+        future.cancel()
+    
     # Try Wikipedia
     try:
-        wiki_results = _search_wikipedia(query)
+        if wiki_future not in done:
+            raise TimeoutError(f"no answer within {SEARCH_TIMEOUT}s")
+        wiki_results = wiki_future.result()
         if wiki_results:
             results.append(wiki_results)
     except Exception as e:
-        errors.append(('Wikipedia', str(e)[:50]))
+        errors.append(('Wikipedia', str(e)[:50] or type(e).__name__))
     
     # Try DuckDuckGo with retry
     try:
-        ddg_results = _search_duckduckgo_with_retry(query, max_results)
+        if ddg_future not in done:
+            raise TimeoutError(f"no answer within {SEARCH_TIMEOUT}s")
+        ddg_results = ddg_future.result()
         if ddg_results:
             results.extend(ddg_results)
     except Exception as e:
-        errors.append(('DuckDuckGo', str(e)[:50]))
+        errors.append(('DuckDuckGo', str(e)[:50] or type(e).__name__))
     
     # FALLBACK: Try simplified query if no results
     if not results and len(query.split()) > 3:
@@ -69,38 +126,109 @@ def research_tool(query: str, max_results: int = 5) -> str:
     return formatted
 
 
+def _disk_cached(func):
+    """
+    Cache a search function's non-empty results on disk, keyed by the
+    normalised query and any extra arguments. Failures are not cached so
+    they are retried on the next call, and expired entries are deleted.
+    """
+    @wraps(func)
+    def wrapper(query: str, *args):
+        normalized = re.sub(r'\s+', ' ', query.strip().lower())
+        key = json.dumps([func.__name__, normalized, *args])
+        path = CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+        
+        try:
+            if time.time() - path.stat().st_mtime < CACHE_TTL:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            path.unlink()
+        except (OSError, ValueError):
+            pass
+        
+        result = func(query, *args)
+        
+        if result:
+            write_json_atomic(path, result)
+            _prune_cache()
+        
+        return result
+    
+    return wrapper
+
+
+def _prune_cache():
+    """Delete expired cache files, at most once per CACHE_PRUNE_INTERVAL"""
+    global _last_prune
+    now = time.time()
+    if now - _last_prune < CACHE_PRUNE_INTERVAL:
+        return
+    _last_prune = now
+    
+    cutoff = now - CACHE_TTL
+    try:
+        entries = list(CACHE_DIR.iterdir())
+    except OSError:
+        return
+    
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
+@_disk_cached
 def _search_wikipedia(query: str):
     """Search Wikipedia with error handling"""
+    # A single API call returns the top search hits with their five-sentence
+    # intro and URL, so the worker is bounded by one REQUEST_TIMEOUT
+    params = {
+        'action': 'query',
+        'format': 'json',
+        'formatversion': 2,
+        'redirects': 1,
+        'generator': 'search',
+        'gsrsearch': query,
+        'gsrlimit': 3,
+        'prop': 'extracts|info|pageprops',
+        'exintro': 1,
+        'explaintext': 1,
+        'exsentences': 5,
+        'inprop': 'url',
+        'ppprop': 'disambiguation',
+    }
+    
     try:
-        summary = wikipedia.summary(query, sentences=5, auto_suggest=True)
-        page = wikipedia.page(query, auto_suggest=True)
+        response = _session.get(WIKIPEDIA_API_URL, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        pages = response.json().get('query', {}).get('pages', [])
+    except (requests.RequestException, ValueError, AttributeError):
+        return None
+    
+    # Best match first; disambiguation pages give way to the next hit
+    for page in sorted(pages, key=lambda p: p.get('index', 0)):
+        if 'disambiguation' in page.get('pageprops', {}) or not page.get('extract'):
+            continue
         return {
-            "title": page.title,
+            "title": page['title'],
             "source": "Wikipedia",
-            "content": summary,
-            "url": page.url
+            "content": page['extract'],
+            "url": page['fullurl']
         }
-    except wikipedia.exceptions.DisambiguationError as e:
-        try:
-            page = wikipedia.page(e.options[0])
-            return {
-                "title": page.title,
-                "source": "Wikipedia",
-                "content": wikipedia.summary(e.options[0], sentences=5),
-                "url": page.url
-            }
-        except:
-            return None
-    except:
-        return None
+    
+    return None
 
 
+@_disk_cached
 def _search_duckduckgo_with_retry(query: str, max_results: int):
     """Search DuckDuckGo with retry logic"""
+    started = time.monotonic()
     
-    for attempt in range(3):
+    for attempt in range(DDG_ATTEMPTS):
         try:
-            ddgs = DDGS()
+            ddgs = _get_ddgs()
             search_results = list(ddgs.text(query, max_results=max_results))
             
             formatted_results = []
@@ -115,9 +243,22 @@ def _search_duckduckgo_with_retry(query: str, max_results: int):
             return formatted_results
             
         except Exception as e:
-            if attempt < 2:
-                time.sleep(1)
+            # Drop the cached client so the retry starts from a fresh session
+            _thread_local.ddgs = None
+            elapsed = time.monotonic() - started
+            if (attempt < DDG_ATTEMPTS - 1
+                    and elapsed + DDG_RETRY_DELAY + REQUEST_TIMEOUT <= SEARCH_TIMEOUT):
+                time.sleep(DDG_RETRY_DELAY)
                 continue
             return []
     
-    return []
\ No newline at end of file
+    return []
+
+
+def _get_ddgs():
+    """Get the DuckDuckGo client for the current thread"""
+    ddgs = getattr(_thread_local, 'ddgs', None)
+    if ddgs is None:
+        ddgs = DDGS(timeout=REQUEST_TIMEOUT)
+        _thread_local.ddgs = ddgs
+    return ddgs
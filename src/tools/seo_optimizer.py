@@ -4,10 +4,28 @@ Analyzes content for SEO effectiveness
 """
 
 import re
-import textstat
 from typing import Dict, List
 from collections import Counter
 from crewai.tools import tool
+from utils.readability import flesch_scores
+
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+# A sentence is any run between terminators that has a non-space character
+_SENTENCE_RE = re.compile(r'[^.!?]*[^.!?\s]')
+_META_RE = re.compile(r'<!-- meta: (.+) -->')
+# Markdown headers: group 1 is the run of '#', group 2 the header text
+_HEADER_RE = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
+# Markdown links: group 1 is set for external (http/https) targets
+_LINK_RE = re.compile(r'\[[^\]]+\]\((http)?')
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'be', 'been',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
+    'it', 'its', 'you', 'your', 'they', 'their', 'we', 'our'
+})
 
 
 @tool("SEO Optimizer")
@@ -43,21 +61,27 @@ def _analyze_seo(content: str, target_keyword: str = None) -> Dict:
     """Perform comprehensive SEO analysis"""
     
     # Clean and prepare text
-    text = re.sub(r'\s+', ' ', content).strip()
+    text = _WS_RE.sub(' ', content).strip()
     text_lower = text.lower()
     
     # Extract words
-    words = re.findall(r'\b[a-z]+\b', text_lower)
+    words = _WORD_RE.findall(text_lower)
     word_count = len(words)
     
-    # Extract sentences
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    
-    # Extract headers (markdown format)
-    headers = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
-    h1_headers = re.findall(r'^#\s+(.+)$', content, re.MULTILINE)
-    h2_headers = re.findall(r'^##\s+(.+)$', content, re.MULTILINE)
+    # Count sentences (only the count is used, so no list is built)
+    sentence_count = sum(1 for _ in _SENTENCE_RE.finditer(text))
+    
+    # Extract headers (markdown format) in a single pass
+    headers, h1_headers, h2_headers = [], [], []
+    if '#' in content:
+        for match in _HEADER_RE.finditer(content):
+            level = len(match.group(1))
+            header = match.group(2)
+            headers.append(header)
+            if level == 1:
+                h1_headers.append(header)
+            elif level == 2:
+                h2_headers.append(header)
     
     # Keyword analysis
     keyword_metrics = {}
@@ -68,8 +92,9 @@ def _analyze_seo(content: str, target_keyword: str = None) -> Dict:
         
         # Check keyword placement
         in_title = keyword_lower in (h1_headers[0].lower() if h1_headers else "")
-        in_first_paragraph = keyword_lower in text_lower[:500]
-        in_headers = any(keyword_lower in h.lower() for h in headers)
+        in_first_paragraph = text_lower.find(keyword_lower, 0, 500) != -1
+        headers_lower = [h.lower() for h in headers]
+        in_headers = any(keyword_lower in h for h in headers_lower)
         
         keyword_metrics = {
             'target_keyword': target_keyword,
@@ -81,20 +106,12 @@ def _analyze_seo(content: str, target_keyword: str = None) -> Dict:
         }
     
     # Get most common words
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                  'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'be', 'been',
-                  'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                  'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
-                  'it', 'its', 'you', 'your', 'they', 'their', 'we', 'our'}
-    
-    filtered_words = [w for w in words if w not in stop_words and len(w) > 3]
-    word_freq = Counter(filtered_words)
-    top_keywords = word_freq.most_common(10)
+    word_freq = Counter(w for w in words if len(w) > 3 and w not in _STOP_WORDS)
+    top_keywords = word_freq.most_common(5)
     
     # Readability metrics
     try:
-        flesch_score = textstat.flesch_reading_ease(text)
-        grade_level = textstat.flesch_kincaid_grade(text)
+        flesch_score, grade_level = flesch_scores(text)
     except:
         flesch_score = 50.0
         grade_level = 10.0
@@ -111,19 +128,24 @@ def _analyze_seo(content: str, target_keyword: str = None) -> Dict:
     has_title = len(h1_headers) > 0
     has_subheaders = len(h2_headers) >= 3
     
-    # Link analysis
-    internal_links = len(re.findall(r'\[([^\]]+)\]\((?!http)', content))
-    external_links = len(re.findall(r'\[([^\]]+)\]\(http', content))
+    # Link analysis (one scan classifies internal vs external)
+    internal_links = external_links = 0
+    if '](' in content:
+        for match in _LINK_RE.finditer(content):
+            if match.group(1):
+                external_links += 1
+            else:
+                internal_links += 1
     
     # Meta description
-    meta_description = re.search(r'<!-- meta: (.+) -->', content)
+    meta_description = _META_RE.search(content) if '<!-- meta: ' in content else None
     has_meta = meta_description is not None
     
     # Compile metrics
     metrics = {
         'word_count': word_count,
-        'sentence_count': len(sentences),
-        'avg_sentence_length': word_count / len(sentences) if sentences else 0,
+        'sentence_count': sentence_count,
+        'avg_sentence_length': word_count / sentence_count if sentence_count else 0,
         'flesch_reading_ease': flesch_score,
         'grade_level': grade_level,
         'readability_rating': readability_rating,
@@ -135,7 +157,7 @@ def _analyze_seo(content: str, target_keyword: str = None) -> Dict:
         'internal_links': internal_links,
         'external_links': external_links,
         'has_meta_description': has_meta,
-        'top_keywords': top_keywords[:5],
+        'top_keywords': top_keywords,
         **keyword_metrics
     }
     
@@ -205,7 +227,7 @@ KEYWORD ANALYSIS:
     
     top_kw_str = ", ".join([f"{word} ({count})" for word, count in metrics['top_keywords']])
     
-    result = f"""
+    parts = [f"""
 SEO ANALYSIS RESULTS
 ====================
 
@@ -229,12 +251,10 @@ STRUCTURE:
 SEO SCORE: {_calculate_seo_score(metrics)}/100
 
 RECOMMENDATIONS:
-"""
-    
-    for i, rec in enumerate(recommendations, 1):
-        result += f"{i}. {rec}\n"
+"""]
+    parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1))
     
-    return result
+    return "".join(parts)
 
 
 def _calculate_seo_score(metrics: Dict) -> int:
@@ -6,6 +6,7 @@ Uses AI to generate creative titles with multiple fallback levels
 from crewai.tools import tool
 import os
 import re
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,6 +14,28 @@ load_dotenv()
 # Configuration flag - set to False to disable LLM usage
 ENABLE_LLM_GENERATION = True
 
+# Numbered list lines: "1. Title", "1) Title", "1- Title" or "1: Title"
+_NUMBERED_LINE_RE = re.compile(r'^[^\S\n]*\d+[\.\)\-\:][^\S\n]*(.+)$', re.MULTILINE)
+_NUMBER_PREFIX_RE = re.compile(r'\d+[\.\)]\s*')
+
+# Title scoring vocabularies
+_POWER_WORDS = ('complete', 'essential', 'ultimate', 'best', 'guide', 'mastering',
+                'expert', 'comprehensive', 'key', 'advanced', 'simple', 'easy',
+                'proven', 'effective', 'practical', 'epic', 'must', 'perfect',
+                'amazing', 'incredible', 'secrets', 'tips', 'strategies', 'ways')
+_JARGON_WORDS = ('paradigm', 'synergy', 'leverage', 'utilize', 'holistic')
+
+# Basic templates that work for most topics, in fallback order
+_TITLE_TEMPLATES = (
+    "The Complete Guide to {topic}",
+    "Understanding {topic}: Key Insights for 2025",
+    "{topic}: Everything You Need to Know",
+    "Mastering {topic}: Expert Tips and Strategies",
+    "{topic}: A Comprehensive Overview",
+    "The Essential Guide to {topic}",
+    "Exploring {topic}: In-Depth Analysis",
+)
+
 
 @tool("Title Generator")
 def title_generator(topic: str, tone: str = "professional", count: int = 5) -> str:
@@ -55,9 +78,16 @@ def title_generator(topic: str, tone: str = "professional", count: int = 5) -> s
 
 def _get_llm():
     """Get available LLM with fallback chain"""
-    
-    gemini_key = os.getenv("GEMINI_API_KEY")
-    groq_key = os.getenv("GROQ_API_KEY")
+    return _build_llm(os.getenv("GEMINI_API_KEY"), os.getenv("GROQ_API_KEY"))
+
+
+@lru_cache(maxsize=4)
+def _build_llm(gemini_key, groq_key):
+    """
+    Build the chat client for the given keys. Cached so repeated tool calls
+    reuse one client (and its HTTP connection pool) instead of rebuilding it.
+    Failures are not cached, so a missing provider is re-checked next call.
+    """
     
     # Try Gemini first
     if gemini_key and gemini_key.startswith('AIza'):
@@ -116,18 +146,14 @@ etc."""
     
     # Parse titles from response
     titles = []
-    for line in content.split('\n'):
-        line = line.strip()
-        # Match "1. Title" or "1) Title" or "1 - Title"
-        match = re.match(r'^\d+[\.\)\-\:]\s*(.+)$', line)
-        if match:
-            title = match.group(1).strip().strip('"\'')
-            if title and len(title) > 10:
-                titles.append(title)
+    for match in _NUMBERED_LINE_RE.finditer(content):
+        title = match.group(1).strip().strip('"\'')
+        if title and len(title) > 10:
+            titles.append(title)
     
     # Fallback parsing if above fails
     if not titles:
-        parts = re.split(r'\d+[\.\)]\s*', content)
+        parts = _NUMBER_PREFIX_RE.split(content)
         titles = [t.strip().strip('"\'') for t in parts if len(t.strip()) > 10]
     
     # If still no titles, use fallback
@@ -140,23 +166,13 @@ etc."""
 def _create_template_titles(topic: str, tone: str, count: int) -> list:
     """Create template-based titles as fallback"""
     
-    titles = []
     topic_clean = topic.strip()
-    
-    # Basic templates that work for most topics
-    titles.append(f"The Complete Guide to {topic_clean}")
-    titles.append(f"Understanding {topic_clean}: Key Insights for 2025")
-    titles.append(f"{topic_clean}: Everything You Need to Know")
-    titles.append(f"Mastering {topic_clean}: Expert Tips and Strategies")
-    titles.append(f"{topic_clean}: A Comprehensive Overview")
-    titles.append(f"The Essential Guide to {topic_clean}")
-    titles.append(f"Exploring {topic_clean}: In-Depth Analysis")
-    
-    return titles[:count]
+    return [template.format(topic=topic_clean) for template in _TITLE_TEMPLATES[:count]]
 
 
+@lru_cache(maxsize=256)
 def _fallback_response(topic: str, tone: str, count: int) -> str:
-    """Generate fallback response when LLM fails"""
+    """Generate fallback response when LLM fails (deterministic, so memoized)"""
     
     # Use template titles
     titles = _create_template_titles(topic, tone, count)
@@ -169,24 +185,24 @@ def _fallback_response(topic: str, tone: str, count: int) -> str:
     
     scored_titles.sort(key=lambda x: x['score'], reverse=True)
     
-    result = f"""
+    parts = [f"""
 TITLE SUGGESTIONS (Template Mode)
 ===================================
 Topic: {topic}
 Note: Using template-based titles (LLM unavailable)
 
 RANKED TITLES:
-"""
+"""]
     
     for i, item in enumerate(scored_titles, 1):
         marker = " <- RECOMMENDED" if i == 1 else ""
-        result += f"\n{i}. \"{item['title']}\"{marker}\n"
-        result += f"   SEO Score: {item['score']}/100\n"
+        parts.append(f"\n{i}. \"{item['title']}\"{marker}\n")
+        parts.append(f"   SEO Score: {item['score']}/100\n")
     
-    result += f"\n{'='*60}\n"
-    result += f"RECOMMENDATION: \"{scored_titles[0]['title']}\"\n"
+    parts.append(f"\n{'='*60}\n")
+    parts.append(f"RECOMMENDATION: \"{scored_titles[0]['title']}\"\n")
     
-    return result
+    return "".join(parts)
 
 
 def _simple_title_response(topic: str) -> str:
@@ -194,10 +210,12 @@ def _simple_title_response(topic: str) -> str:
     return f"Suggested Title: {topic.strip()}"
 
 
+@lru_cache(maxsize=2048)
 def _score_title(title: str, topic: str) -> int:
     """Score a title for SEO and engagement (0-100)"""
     
     score = 0
+    title_lower = title.lower()
     
     # 1. Length Score (25 points) - More lenient
     title_len = len(title)
@@ -211,7 +229,7 @@ def _score_title(title: str, topic: str) -> int:
     # 2. Topic Inclusion (30 points) - More generous
     topic_words = [w for w in topic.lower().split() if len(w) > 2]
     if topic_words:
-        topic_in_title = sum(1 for word in topic_words if word in title.lower())
+        topic_in_title = sum(1 for word in topic_words if word in title_lower)
         if topic_in_title >= len(topic_words) * 0.7:  # 70% coverage
             score += 30
         elif topic_in_title >= len(topic_words) * 0.5:  # 50% coverage
@@ -222,11 +240,7 @@ def _score_title(title: str, topic: str) -> int:
         score += 20
     
     # 3. Engagement Words (25 points) - Expanded list
-    power_words = ['complete', 'essential', 'ultimate', 'best', 'guide', 'mastering',
-                   'expert', 'comprehensive', 'key', 'advanced', 'simple', 'easy',
-                   'proven', 'effective', 'practical', 'epic', 'must', 'perfect',
-                   'amazing', 'incredible', 'secrets', 'tips', 'strategies', 'ways']
-    power_count = sum(1 for pw in power_words if pw in title.lower())
+    power_count = sum(1 for pw in _POWER_WORDS if pw in title_lower)
     if power_count >= 2:
         score += 25
     elif power_count >= 1:
@@ -235,13 +249,12 @@ def _score_title(title: str, topic: str) -> int:
         score += 10
     
     # 4. Numbers (15 points)
-    has_number = any(char.isdigit() for char in title)
+    has_number = any(map(str.isdigit, title))
     score += 15 if has_number else 5
     
     # 5. Clarity Bonus (5 points)
     # No overly complex jargon
-    complex = ['paradigm', 'synergy', 'leverage', 'utilize', 'holistic']
-    has_jargon = any(cw in title.lower() for cw in complex)
+    has_jargon = any(cw in title_lower for cw in _JARGON_WORDS)
     score += 5 if not has_jargon else 2
     
     return min(score, 100)
@@ -250,26 +263,26 @@ def _score_title(title: str, topic: str) -> int:
 def _format_results(scored_titles: list, topic: str) -> str:
     """Format title generation results"""
     
-    result = f"""
+    parts = [f"""
 TITLE SUGGESTIONS
 ==================
 Topic: {topic}
 Generated: {len(scored_titles)} AI-powered options
 
 RANKED TITLES:
-"""
+"""]
     
     for i, item in enumerate(scored_titles, 1):
         marker = " <- RECOMMENDED" if i == 1 else ""
-        result += f"\n{i}. \"{item['title']}\"{marker}\n"
-        result += f"   SEO Score: {item['score']}/100\n"
+        parts.append(f"\n{i}. \"{item['title']}\"{marker}\n")
+        parts.append(f"   SEO Score: {item['score']}/100\n")
     
-    result += f"\n{'='*60}\n"
-    result += f"RECOMMENDATION: Use Title #1\n"
-    result += f"\"{scored_titles[0]['title']}\"\n"
-    result += f"Score: {scored_titles[0]['score']}/100\n"
+    parts.append(f"\n{'='*60}\n")
+    parts.append("RECOMMENDATION: Use Title #1\n")
+    parts.append(f"\"{scored_titles[0]['title']}\"\n")
+    parts.append(f"Score: {scored_titles[0]['score']}/100\n")
     
-    return result
+    return "".join(parts)
 
 
 def generate_titles(topic: str, tone: str = "professional", count: int = 5) -> str:
@@ -4,11 +4,49 @@ Analyzes writing style and tone
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import textstat
 import re
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict
 from crewai.tools import tool
+from utils.readability import flesch_scores, difficult_words
+
+# Shared HTTP session: keeps TCP/TLS connections alive between URL fetches
+_session = requests.Session()
+_session.headers.update({'User-Agent': 'Mozilla/5.0'})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+# Pages are read up to this many (decoded) bytes; the rest is ignored
+MAX_PAGE_BYTES = 2_000_000
+# Uncompressed bodies smaller than this cannot yield enough text to analyse
+MIN_PAGE_BYTES = 100
+
+# Extracted page text by URL, oldest first: url -> (fetched_at, text)
+URL_CACHE_TTL = 3600
+URL_CACHE_SIZE = 128
+_url_cache = OrderedDict()
+_url_cache_lock = threading.Lock()
+
+# Page chrome removed before paragraph text is extracted
+_STRIP_TAGS = ('script', 'style', 'nav', 'footer', 'header')
+
+_WS_RE = re.compile(r'\s+')
+# Maps '!' and '?' onto '.' so sentences split with plain str.split('.')
+_SENTENCE_END_TABLE = str.maketrans('!?', '..')
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_CONTRACTION_RE = re.compile(r"\b\w+'\w+\b")
+# Group 1 is set for first-person words, group 2 for second-person words
+_PERSON_RE = re.compile(r'\b(?:(I|we|my|our)|(you|your))\b', re.IGNORECASE)
 
 
 @tool("Tone Analyzer")
@@ -32,8 +70,12 @@ def tone_analyzer(content: str, target_tone: str = "professional") -> str:
         else:
             text = content
         
-        if not text or len(text) < 100:
+        # Padding does not count towards the minimum, and input without a
+        # single word (e.g. punctuation only) never reaches textstat
+        if not text or len(text.strip()) < 100:
             return "Error: Content too short for meaningful analysis (need at least 100 characters)"
+        if not _WORD_RE.search(text):
+            return "Error: Content contains no words to analyze"
         
         # Perform analysis
         analysis = _analyze_text(text)
@@ -48,58 +90,114 @@ def tone_analyzer(content: str, target_tone: str = "professional") -> str:
 
 
 def _fetch_content_from_url(url: str) -> str:
-    """Fetch and extract text content from URL"""
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    response = requests.get(url, headers=headers, timeout=10)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    """Fetch and extract text content from URL, reusing recent fetches"""
+    now = time.monotonic()
+    
+    with _url_cache_lock:
+        cached = _url_cache.get(url)
+        if cached and now - cached[0] < URL_CACHE_TTL:
+            _url_cache.move_to_end(url)
+            return cached[1]
+    
+    text = _download_text(url)
+    
+    with _url_cache_lock:
+        _url_cache[url] = (now, text)
+        _url_cache.move_to_end(url)
+        while len(_url_cache) > URL_CACHE_SIZE:
+            _url_cache.popitem(last=False)
+    
+    return text
+
+
+def _download_text(url: str) -> str:
+    """Download a page and extract its paragraph text"""
+    with _session.get(url, timeout=(3, 10), stream=True) as response:
+        length = response.headers.get('Content-Length', '')
+        if (length.isdigit() and int(length) < MIN_PAGE_BYTES
+                and 'Content-Encoding' not in response.headers):
+            return ''
+        response.raw.decode_content = True
+        html = response.raw.read(MAX_PAGE_BYTES)
     
-    for script in soup(["script", "style", "nav", "footer", "header"]):
-        script.decompose()
+    soup = BeautifulSoup(html, 'lxml')
     
-    paragraphs = soup.find_all('p')
-    text = ' '.join([p.get_text() for p in paragraphs])
+    for tag in soup.find_all(_STRIP_TAGS):
+        tag.decompose()
+    
+    text = ' '.join(p.get_text() for p in soup.find_all('p'))
     return text.strip()
 
 
 def _analyze_text(text: str) -> Dict:
     """Perform comprehensive text analysis"""
     
-    text = re.sub(r'\s+', ' ', text).strip()
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    words = re.findall(r'\b[a-zA-Z]+\b', text)
+    text = _WS_RE.sub(' ', text).strip()
+    sentences = text.translate(_SENTENCE_END_TABLE).split('.')
+    sentences = [s for s in map(str.strip, sentences) if s]
+    words = _WORD_RE.findall(text)
     
     try:
-        flesch_score = textstat.flesch_reading_ease(text)
-        grade_level = textstat.flesch_kincaid_grade(text)
-        difficult_words_count = textstat.difficult_words(text)
+        flesch_score, grade_level = flesch_scores(text)
+        difficult_words_count = difficult_words(text)
     except:
         flesch_score = 50.0
         grade_level = 10.0
         difficult_words_count = int(len(words) * 0.15)
     
+    # Bucket sentences by length in one pass (each sentence split once)
+    short_sentences = medium_sentences = long_sentences = 0
+    for sentence in sentences:
+        sentence_words = len(sentence.split())
+        if sentence_words < 10:
+            short_sentences += 1
+        elif sentence_words <= 20:
+            medium_sentences += 1
+        else:
+            long_sentences += 1
+    
+    uses_first_person, uses_second_person = _detect_person(text)
+    
     analysis = {
         'word_count': len(words),
         'sentence_count': len(sentences),
         'avg_sentence_length': len(words) / len(sentences) if sentences else 0,
-        'avg_word_length': sum(len(w) for w in words) / len(words) if words else 0,
+        'avg_word_length': sum(map(len, words)) / len(words) if words else 0,
         'flesch_reading_ease': flesch_score,
         'flesch_kincaid_grade': grade_level,
         'difficult_words': difficult_words_count,
         'complex_word_percentage': (difficult_words_count / len(words) * 100) if words else 0,
-        'short_sentences': sum(1 for s in sentences if len(s.split()) < 10),
-        'medium_sentences': sum(1 for s in sentences if 10 <= len(s.split()) <= 20),
-        'long_sentences': sum(1 for s in sentences if len(s.split()) > 20),
+        'short_sentences': short_sentences,
+        'medium_sentences': medium_sentences,
+        'long_sentences': long_sentences,
         'question_count': text.count('?'),
         'exclamation_count': text.count('!'),
-        'uses_contractions': bool(re.search(r"\b\w+'\w+\b", text)),
-        'uses_first_person': bool(re.search(r'\b(I|we|my|our)\b', text, re.IGNORECASE)),
-        'uses_second_person': bool(re.search(r'\b(you|your)\b', text, re.IGNORECASE)),
+        'uses_contractions': bool(_CONTRACTION_RE.search(text)),
+        'uses_first_person': uses_first_person,
+        'uses_second_person': uses_second_person,
     }
     
     return analysis
 
 
+def _detect_person(text: str) -> tuple:
+    """
+    Detect first- and second-person usage in one scan, stopping as soon as
+    both have been seen
+    """
+    uses_first = uses_second = False
+    
+    for match in _PERSON_RE.finditer(text):
+        if match.group(1):
+            uses_first = True
+        else:
+            uses_second = True
+        if uses_first and uses_second:
+            break
+    
+    return uses_first, uses_second
+
+
 def _generate_style_guidelines(analysis: Dict, target_tone: str) -> Dict:
     """Generate style guidelines based on analysis"""
     
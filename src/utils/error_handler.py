@@ -4,6 +4,7 @@ Provides decorators for retry logic, error handling, and performance logging
 """
 
 import logging
+import logging.handlers
 import time
 from functools import wraps
 from typing import Callable, Any
@@ -14,18 +15,36 @@ from pathlib import Path
 logs_dir = Path("logs")
 logs_dir.mkdir(exist_ok=True)
 
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# File records are buffered and written in batches; a WARNING or worse
+# flushes the buffer immediately so the lines leading up to it are on disk
+_file_handler = logging.handlers.RotatingFileHandler(
+    logs_dir / 'content_creation.log',
+    maxBytes=5_000_000,
+    backupCount=3
+)
+_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+_buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.WARNING,
+    target=_file_handler
+)
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
-        logging.FileHandler(logs_dir / 'content_creation.log'),
+        _buffered_file_handler,
         logging.StreamHandler()
     ]
 )
 
 logger = logging.getLogger('ContentCreation')
 
+_BANNER = "=" * 60
+
 
 def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
     """
@@ -49,11 +68,11 @@ def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
                     retries += 1
                     
                     if retries >= max_retries:
-                        logger.error(f"Failed after {max_retries} attempts: {func.__name__}")
+                        logger.error("Failed after %d attempts: %s", max_retries, func.__name__)
                         raise
                     
                     delay = base_delay * (2 ** (retries - 1))
-                    logger.warning(f"Retry {retries}/{max_retries} for {func.__name__} after {delay}s delay")
+                    logger.warning("Retry %d/%d for %s after %ss delay", retries, max_retries, func.__name__, delay)
                     time.sleep(delay)
             
             raise last_exception
@@ -75,7 +94,7 @@ def handle_errors(error_message: str = "Operation failed"):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(f"Error in {func.__name__}: {str(e)}", exc_info=True)
+                logger.error("Error in %s: %s", func.__name__, e, exc_info=True)
                 return f"{error_message}: {str(e)}"
         return wrapper
     return decorator
@@ -87,20 +106,21 @@ def log_performance(func: Callable) -> Callable:
     
     Logs start time, end time, and duration of function execution
     """
+    name = func.__name__
+    
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        start_time = time.time()
-        logger.info(f"Starting {func.__name__}")
+        start_time = time.perf_counter()
+        logger.info("Starting %s", name)
         
         try:
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
-            logger.info(f"Completed {func.__name__} in {duration:.2f}s")
-            return result
         except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"Failed {func.__name__} after {duration:.2f}s: {str(e)}")
+            logger.error("Failed %s after %.2fs: %s", name, time.perf_counter() - start_time, e)
             raise
+        
+        logger.info("Completed %s in %.2fs", name, time.perf_counter() - start_time)
+        return result
     
     return wrapper
 
@@ -115,21 +135,20 @@ def log_agent_execution(agent_name: str):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            logger.info(f"{'='*60}")
-            logger.info(f"AGENT: {agent_name}")
-            logger.info(f"{'='*60}")
+            logger.info(_BANNER)
+            logger.info("AGENT: %s", agent_name)
+            logger.info(_BANNER)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
-                logger.info(f"✅ {agent_name} completed successfully in {duration:.2f}s")
-                return result
             except Exception as e:
-                duration = time.time() - start_time
-                logger.error(f"❌ {agent_name} failed after {duration:.2f}s: {str(e)}")
+                logger.error("❌ %s failed after %.2fs: %s", agent_name, time.perf_counter() - start_time, e)
                 raise
+            
+            logger.info("✅ %s completed successfully in %.2fs", agent_name, time.perf_counter() - start_time)
+            return result
         
         return wrapper
     return decorator
\ No newline at end of file
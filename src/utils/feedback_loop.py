@@ -15,6 +15,7 @@ class FeedbackLoop:
     def __init__(self, max_attempts=2):
         self.max_attempts = max_attempts
         self.attempt_history = []
+        self.best_score = None
     
     def should_regenerate(self, quality_score, threshold, attempt_num):
         """Decide if regeneration needed"""
@@ -80,6 +81,9 @@ class FeedbackLoop:
             'grade': grade,
             'issues': issues
         })
+        
+        if self.best_score is None or quality_score > self.best_score:
+            self.best_score = quality_score
     
     def display_history(self):
         """Show attempt history"""
@@ -97,7 +101,7 @@ class FeedbackLoop:
         
         for record in self.attempt_history:
             issues_str = ", ".join(record['issues']) if record['issues'] else "None"
-            marker = "BEST" if record['score'] == max(h['score'] for h in self.attempt_history) else ""
+            marker = "BEST" if record['score'] == self.best_score else ""
             
             table.add_row(
                 f"#{record['attempt']} {marker}",
@@ -123,6 +127,7 @@ class FeedbackLoop:
     def reset(self):
         """Reset for new generation"""
         self.attempt_history = []
+        self.best_score = None
 
 
 # Global instance
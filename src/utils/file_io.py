@@ -0,0 +1,36 @@
+"""
+File I/O Helpers
+Small shared helpers for the on-disk caches and state files
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+
+def write_json_atomic(path: Path, data) -> bool:
+    """
+    Write data as JSON without ever leaving a half-written file behind.
+
+    The JSON goes to a temp file unique to this process/thread, which then
+    replaces the target in one step. Failures are swallowed: callers use
+    this for caches and state, where losing a write is harmless.
+
+    Returns:
+        True if the file was written
+    """
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
@@ -3,13 +3,41 @@ LLM Health Checker
 Tests LLM availability before execution and enables auto-fallback
 """
 
+import hashlib
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from dotenv import load_dotenv
 from rich.console import Console
+from utils.file_io import write_json_atomic
 
 load_dotenv()
 console = Console()
 
+# Providers are probed concurrently, so a check takes as long as the slowest
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health")
+
+# Seconds a single provider probe may take before it counts as unhealthy
+HEALTH_CHECK_TIMEOUT = 10
+
+# Lower-cased substrings used to classify probe errors
+_GEMINI_RATE_LIMIT_MARKERS = ('429', 'quota')
+_GROQ_RATE_LIMIT_MARKERS = ('429', 'rate_limit')
+_AUTH_MARKERS = ('401', '403')
+_TIMEOUT_MARKERS = ('timed out', 'deadline')
+
+# Healthy probe results are reused for this many seconds (0 disables reuse).
+# Failures are never reused, so a transient timeout or 429 is re-probed on
+# the next check instead of blocking startup for the whole TTL
+HEALTH_CACHE_TTL = int(os.getenv("LLM_HEALTH_CACHE_TTL", "300"))
+
+# Healthy probe results survive restarts here, so back-to-back runs skip the
+# probes; failures are never written
+HEALTH_STATE_PATH = Path("cache") / "llm_health.json"
+
 
 class LLMHealthChecker:
     """Check which LLMs are available and healthy"""
@@ -18,24 +46,40 @@ class LLMHealthChecker:
         self.gemini_key = os.getenv("GEMINI_API_KEY")
         self.groq_key = os.getenv("GROQ_API_KEY")
         self.health_status = {}
+        # provider -> [checked_at, healthy, key fingerprint] of the last
+        # successful probe. checked_at is wall-clock time.time(), not
+        # monotonic: entries are persisted and compared in later processes,
+        # where a monotonic reading from another run is meaningless
+        self._cache = _load_state()
+        self._cache_lock = threading.Lock()
+        # SDK clients built on first probe and reused (keeps connections alive)
+        self._gemini_model = None
+        self._groq_client = None
     
-    def check_all_providers(self):
-        """Health check all providers"""
+    def check_all_providers(self, force: bool = False):
+        """
+        Health check all providers
+        
+        Args:
+            force: Probe every provider even if a recent healthy result exists
+        """
         
         console.print("\n[cyan]🏥 Running LLM Health Checks...[/cyan]\n")
         
+        # Start probes for every provider with a key
+        gemini_future = _executor.submit(self._check, 'Gemini', self.gemini_key, self._test_gemini, force) if self.gemini_key else None
+        groq_future = _executor.submit(self._check, 'Groq', self.groq_key, self._test_groq, force) if self.groq_key else None
+        
         # Check Gemini
-        if self.gemini_key:
-            gemini_healthy = self._test_gemini()
-            self.health_status['gemini'] = gemini_healthy
+        if gemini_future:
+            self.health_status['gemini'] = gemini_future.result()
         else:
             console.print("  [dim]⚠️ Gemini: No API key[/dim]")
             self.health_status['gemini'] = False
         
         # Check Groq
-        if self.groq_key:
-            groq_healthy = self._test_groq()
-            self.health_status['groq'] = groq_healthy
+        if groq_future:
+            self.health_status['groq'] = groq_future.result()
         else:
             console.print("  [dim]⚠️ Groq: No API key[/dim]")
             self.health_status['groq'] = False
@@ -58,30 +102,63 @@ class LLMHealthChecker:
         
         return None
     
+    def _check(self, name, api_key, probe, force=False):
+        """Return a recent healthy result for the provider, else probe it"""
+        now = time.time()
+        # Results for a different key (e.g. after fixing .env) are ignored
+        fingerprint = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+        cached = self._cache.get(name)
+        
+        if (not force and isinstance(cached, list) and len(cached) == 3
+                and cached[1] is True and cached[2] == fingerprint
+                and 0 <= now - cached[0] < HEALTH_CACHE_TTL):
+            console.print(f"  [green]✅ {name}: Healthy (cached)[/green]")
+            return True
+        
+        healthy = probe()
+        
+        with self._cache_lock:
+            if healthy:
+                self._cache[name] = [now, True, fingerprint]
+            else:
+                self._cache.pop(name, None)
+            _save_state(self._cache)
+        
+        return healthy
+    
     def _test_gemini(self):
         """Test Gemini API"""
         try:
             import google.generativeai as genai
             
-            genai.configure(api_key=self.gemini_key)
-            model = genai.GenerativeModel('gemini-2.5-flash')
+            if self._gemini_model is None:
+                genai.configure(api_key=self.gemini_key)
+                self._gemini_model = genai.GenerativeModel('gemini-2.5-flash')
             
-            # Quick test
-            response = model.generate_content("Say 'ok'")
+            # One-token generation: cheap, but unlike a metadata lookup it
+            # is refused once the quota is exhausted. Any answer counts,
+            # since a single token may be cut off before any text
+            response = self._gemini_model.generate_content(
+                "Say 'ok'",
+                generation_config={'max_output_tokens': 1},
+                request_options={'timeout': HEALTH_CHECK_TIMEOUT}
+            )
             
-            if response.text:
+            if response.candidates:
                 console.print("  [green]✅ Gemini: Healthy[/green]")
                 return True
             
         except Exception as e:
-            error_msg = str(e)
+            error_lower = str(e).lower()
             
-            if "429" in error_msg or "quota" in error_msg.lower():
+            if any(m in error_lower for m in _GEMINI_RATE_LIMIT_MARKERS):
                 console.print("  [yellow]⚠️ Gemini: Rate limited (quota exceeded)[/yellow]")
-            elif "404" in error_msg:
+            elif "404" in error_lower:
                 console.print("  [yellow]⚠️ Gemini: Model not found[/yellow]")
-            elif "401" in error_msg or "403" in error_msg:
+            elif any(m in error_lower for m in _AUTH_MARKERS):
                 console.print("  [red]❌ Gemini: Invalid API key[/red]")
+            elif any(m in error_lower for m in _TIMEOUT_MARKERS):
+                console.print("  [yellow]⚠️ Gemini: Timed out[/yellow]")
             else:
                 console.print(f"  [yellow]⚠️ Gemini: {str(e)[:50]}...[/yellow]")
             
@@ -92,28 +169,30 @@ class LLMHealthChecker:
     def _test_groq(self):
         """Test Groq API"""
         try:
-            from groq import Groq
+            if self._groq_client is None:
+                from groq import Groq
+                self._groq_client = Groq(api_key=self.groq_key, timeout=HEALTH_CHECK_TIMEOUT)
             
-            client = Groq(api_key=self.groq_key)
-            
-            # Quick test
-            response = client.chat.completions.create(
+            # One-token generation, so rate limits surface here too
+            response = self._groq_client.chat.completions.create(
                 model="llama-3.3-70b-versatile",
                 messages=[{"role": "user", "content": "Say 'ok'"}],
-                max_tokens=5
+                max_tokens=1
             )
             
-            if response.choices[0].message.content:
+            if response.choices:
                 console.print("  [green]✅ Groq: Healthy[/green]")
                 return True
             
         except Exception as e:
-            error_msg = str(e)
+            error_lower = str(e).lower()
             
-            if "429" in error_msg or "rate_limit" in error_msg.lower():
+            if any(m in error_lower for m in _GROQ_RATE_LIMIT_MARKERS):
                 console.print("  [yellow]⚠️ Groq: Rate limited[/yellow]")
-            elif "401" in error_msg or "403" in error_msg:
+            elif any(m in error_lower for m in _AUTH_MARKERS):
                 console.print("  [red]❌ Groq: Invalid API key[/red]")
+            elif any(m in error_lower for m in _TIMEOUT_MARKERS):
+                console.print("  [yellow]⚠️ Groq: Timed out[/yellow]")
             else:
                 console.print(f"  [yellow]⚠️ Groq: {str(e)[:50]}...[/yellow]")
             
@@ -135,5 +214,28 @@ class LLMHealthChecker:
         return chain
 
 
+def _load_state():
+    """Read persisted healthy probe results, or start empty"""
+    try:
+        with open(HEALTH_STATE_PATH, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(state, dict):
+        return {}
+    
+    # Older files may hold failed probes; those must not block a new run
+    return {
+        name: entry for name, entry in state.items()
+        if isinstance(entry, list) and len(entry) == 3 and entry[1] is True
+    }
+
+
+def _save_state(state):
+    """Write probe results atomically; persistence is best effort"""
+    write_json_atomic(HEALTH_STATE_PATH, state)
+
+
 # Singleton
 health_checker = LLMHealthChecker()
\ No newline at end of file
@@ -5,14 +5,36 @@ Supports: Gemini → Groq → Ollama
 
 import os
 import time
+import asyncio
+import atexit
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any
 from enum import Enum
-import google.generativeai as genai
-from groq import Groq
-import ollama
+from pathlib import Path
+from utils.file_io import write_json_atomic
 from dotenv import load_dotenv
 
 load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Deterministic (temperature 0) responses kept in memory, oldest first
+RESPONSE_CACHE_SIZE = 1024
+
+# Workers reserved for race mode, one per provider. Losing calls run to
+# completion here, so nothing else is submitted to this pool
+_race_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="llm-race")
+
+# Seconds a provider that just failed is tried after the others; each further
+# consecutive failure doubles the wait, up to MAX_FAILURE_COOLDOWN
+FAILURE_COOLDOWN = 60
+MAX_FAILURE_COOLDOWN = 15 * 60
+
+# Usage counts and active cooldowns are carried over between runs here
+MANAGER_STATE_PATH = Path("cache") / "llm_manager.json"
 
 class LLMProvider(Enum):
     """Available LLM providers"""
@@ -37,11 +59,40 @@ class LLMManager:
         self.timeout = int(os.getenv("TIMEOUT_SECONDS", "30"))
         self.verbose = os.getenv("VERBOSE", "true").lower() == "true"
         
+        if self.verbose:
+            # Status lines below are logged at INFO: bring up the project's
+            # console and log file handlers (a no-op if the application has
+            # configured logging itself) and let this logger pass INFO
+            import utils.error_handler  # noqa: F401
+            if logger.level == logging.NOTSET:
+                logger.setLevel(logging.INFO)
+        
         # Usage tracking
         self.usage_stats = {
-            "gemini": {"calls": 0, "failures": 0},
-            "groq": {"calls": 0, "failures": 0},
-            "ollama": {"calls": 0, "failures": 0}
+            "gemini": {"calls": 0, "failures": 0, "raced": 0},
+            "groq": {"calls": 0, "failures": 0, "raced": 0},
+            "ollama": {"calls": 0, "failures": 0, "raced": 0}
+        }
+        
+        # (provider, prompt, max_tokens) -> text for temperature 0 calls
+        self._response_cache = OrderedDict()
+        # generate_async runs generate() on worker threads
+        self._response_cache_lock = threading.Lock()
+        
+        # provider -> monotonic time until which it is tried last, and the
+        # number of consecutive failures that set it
+        self._cooldown_until = {}
+        self._failure_streak = {}
+        
+        # Race mode and generate_async update the counters, cooldowns and
+        # streaks from worker threads
+        self._state_lock = threading.Lock()
+        
+        # provider -> generate method, looked up once per call
+        self._generators = {
+            LLMProvider.GEMINI: self._generate_gemini,
+            LLMProvider.GROQ: self._generate_groq,
+            LLMProvider.OLLAMA: self._generate_ollama
         }
         
         # Initialize clients
@@ -51,46 +102,51 @@ class LLMManager:
         """Initialize all available LLM clients"""
         try:
             if self.gemini_key:
+                import google.generativeai as genai
                 genai.configure(api_key=self.gemini_key)
                 self.gemini_client = genai.GenerativeModel(self.gemini_model)
                 if self.verbose:
-                    print("✅ Gemini initialized")
+                    logger.info("✅ Gemini initialized")
             else:
                 self.gemini_client = None
                 if self.verbose:
-                    print("⚠️ Gemini API key not found")
+                    logger.warning("⚠️ Gemini API key not found")
         except Exception as e:
             self.gemini_client = None
             if self.verbose:
-                print(f"❌ Gemini initialization failed: {e}")
+                logger.error("❌ Gemini initialization failed: %s", e)
         
         try:
             if self.groq_key:
+                from groq import Groq
                 self.groq_client = Groq(api_key=self.groq_key)
                 if self.verbose:
-                    print("✅ Groq initialized")
+                    logger.info("✅ Groq initialized")
             else:
                 self.groq_client = None
                 if self.verbose:
-                    print("⚠️ Groq API key not found")
+                    logger.warning("⚠️ Groq API key not found")
         except Exception as e:
             self.groq_client = None
             if self.verbose:
-                print(f"❌ Groq initialization failed: {e}")
+                logger.error("❌ Groq initialization failed: %s", e)
         
         try:
             # Test Ollama connection
+            import ollama
             ollama.list()
+            self._ollama = ollama
             self.ollama_available = True
             if self.verbose:
-                print("✅ Ollama initialized")
+                logger.info("✅ Ollama initialized")
         except Exception as e:
             self.ollama_available = False
             if self.verbose:
-                print(f"⚠️ Ollama not available: {e}")
+                logger.warning("⚠️ Ollama not available: %s", e)
     
     def generate(self, prompt: str, max_tokens: int = 2000, 
-                 temperature: float = 0.7, provider: Optional[LLMProvider] = None) -> str:
+                 temperature: float = 0.7, provider: Optional[LLMProvider] = None,
+                 race: bool = False) -> str:
         """
         Generate text with automatic fallback
         
@@ -99,21 +155,67 @@ class LLMManager:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             provider: Force specific provider (optional)
+            race: Ask all available providers at once and return the first
+                answer (lower latency, but every provider is billed: losing
+                calls keep running and their answers are discarded)
         
         Returns:
             Generated text
         """
+        # Only temperature 0 output is reproducible enough to reuse
+        cache_key = None
+        if temperature == 0:
+            cache_key = (provider.value if provider else None, prompt, max_tokens)
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    return cached
+        
+        if race and not provider:
+            result = self._generate_race(prompt, max_tokens, temperature)
+        else:
+            result = self._generate_uncached(prompt, max_tokens, temperature, provider)
+        
+        if cache_key is not None and result:
+            with self._response_cache_lock:
+                self._response_cache[cache_key] = result
+                self._response_cache.move_to_end(cache_key)
+                while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+        
+        return result
+    
+    async def generate_async(self, prompt: str, max_tokens: int = 2000,
+                             temperature: float = 0.7,
+                             provider: Optional[LLMProvider] = None,
+                             race: bool = False) -> str:
+        """
+        Awaitable generate() for async callers
+        
+        The blocking SDK call runs in a worker thread, so the event loop keeps
+        serving other tasks and several prompts can be in flight at once.
+        """
+        return await asyncio.to_thread(
+            self.generate, prompt, max_tokens, temperature, provider, race
+        )
+    
+    def _generate_uncached(self, prompt: str, max_tokens: int,
+                           temperature: float, provider: Optional[LLMProvider]) -> str:
+        """Dispatch to the requested provider, or fall back through all of them"""
         if provider:
             return self._generate_with_provider(
                 prompt, max_tokens, temperature, provider
             )
         
-        # Try providers in order: Gemini → Groq → Ollama
-        providers = [
-            (LLMProvider.GEMINI, self.gemini_client),
-            (LLMProvider.GROQ, self.groq_client),
-            (LLMProvider.OLLAMA, self.ollama_available)
-        ]
+        providers = self._provider_chain()
+        
+        # Providers that failed recently go to the back of the queue, so an
+        # outage costs one failed round trip instead of one per call
+        now = time.monotonic()
+        with self._state_lock:
+            cooling = {name for name, until in self._cooldown_until.items() if until > now}
+        providers.sort(key=lambda p: p[0].value in cooling)
         
         for provider_enum, is_available in providers:
             if is_available:
@@ -121,28 +223,83 @@ class LLMManager:
                     result = self._generate_with_provider(
                         prompt, max_tokens, temperature, provider_enum
                     )
+                    self._record_success(provider_enum)
                     return result
                 except Exception as e:
-                    if self.verbose:
-                        print(f"⚠️ {provider_enum.value} failed: {e}")
-                    self.usage_stats[provider_enum.value]["failures"] += 1
+                    self._record_failure(provider_enum, e)
                     continue
         
         raise Exception("All LLM providers failed. Check your API keys and Ollama installation.")
     
+    def _generate_race(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """Send the prompt to every available provider and keep the first answer"""
+        futures = {
+            _race_executor.submit(
+                self._generate_with_provider, prompt, max_tokens, temperature, provider_enum
+            ): provider_enum
+            for provider_enum, is_available in self._provider_chain()
+            if is_available
+        }
+        
+        handled = set()
+        for future in as_completed(futures):
+            handled.add(future)
+            provider_enum = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                self._record_failure(provider_enum, e)
+                continue
+            
+            # Drop requests that have not started; running ones cannot be
+            # stopped, so they finish unused and are counted as raced
+            for other, other_enum in futures.items():
+                if other in handled or other.done():
+                    continue
+                if not other.cancel():
+                    with self._state_lock:
+                        self.usage_stats[other_enum.value]["raced"] += 1
+            self._record_success(provider_enum)
+            return result
+        
+        raise Exception("All LLM providers failed. Check your API keys and Ollama installation.")
+    
+    def _provider_chain(self) -> list:
+        """Providers in preference order: Gemini → Groq → Ollama"""
+        return [
+            (LLMProvider.GEMINI, self.gemini_client),
+            (LLMProvider.GROQ, self.groq_client),
+            (LLMProvider.OLLAMA, self.ollama_available)
+        ]
+    
+    def _record_failure(self, provider: LLMProvider, error: Exception):
+        """Count a failed call and put the provider on a growing cooldown"""
+        if self.verbose:
+            logger.warning("⚠️ %s failed: %s", provider.value, error)
+        with self._state_lock:
+            self.usage_stats[provider.value]["failures"] += 1
+            
+            streak = self._failure_streak.get(provider.value, 0) + 1
+            self._failure_streak[provider.value] = streak
+            cooldown = min(FAILURE_COOLDOWN * 2 ** (streak - 1), MAX_FAILURE_COOLDOWN)
+            self._cooldown_until[provider.value] = time.monotonic() + cooldown
+    
+    def _record_success(self, provider: LLMProvider):
+        """A provider that answered is back at its normal position"""
+        with self._state_lock:
+            self._cooldown_until.pop(provider.value, None)
+            self._failure_streak.pop(provider.value, None)
+    
     def _generate_with_provider(self, prompt: str, max_tokens: int, 
                                 temperature: float, provider: LLMProvider) -> str:
         """Generate text using a specific provider"""
-        self.usage_stats[provider.value]["calls"] += 1
-        
-        if provider == LLMProvider.GEMINI:
-            return self._generate_gemini(prompt, max_tokens, temperature)
-        elif provider == LLMProvider.GROQ:
-            return self._generate_groq(prompt, max_tokens, temperature)
-        elif provider == LLMProvider.OLLAMA:
-            return self._generate_ollama(prompt, max_tokens, temperature)
-        else:
+        generator = self._generators.get(provider)
+        if generator is None:
             raise ValueError(f"Unknown provider: {provider}")
+        
+        with self._state_lock:
+            self.usage_stats[provider.value]["calls"] += 1
+        return generator(prompt, max_tokens, temperature)
     
     def _generate_gemini(self, prompt: str, max_tokens: int, temperature: float) -> str:
         """Generate using Gemini"""
@@ -150,7 +307,7 @@ class LLMManager:
             raise Exception("Gemini client not initialized")
         
         if self.verbose:
-            print("🔵 Using Gemini...")
+            logger.debug("🔵 Using Gemini...")
         
         generation_config = {
             "temperature": temperature,
@@ -170,7 +327,7 @@ class LLMManager:
             raise Exception("Groq client not initialized")
         
         if self.verbose:
-            print("🟠 Using Groq...")
+            logger.debug("🟠 Using Groq...")
         
         response = self.groq_client.chat.completions.create(
             model=self.groq_model,
@@ -187,9 +344,9 @@ class LLMManager:
             raise Exception("Ollama is not available")
         
         if self.verbose:
-            print("🟢 Using Ollama (local)...")
+            logger.debug("🟢 Using Ollama (local)...")
         
-        response = ollama.generate(
+        response = self._ollama.generate(
             model=self.ollama_model,
             prompt=prompt,
             options={
@@ -200,6 +357,47 @@ class LLMManager:
         
         return response['response']
     
+    def _load_state(self):
+        """Merge usage counts and unexpired cooldowns saved by earlier runs"""
+        try:
+            with open(MANAGER_STATE_PATH, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            
+            for name, saved in state.get("usage_stats", {}).items():
+                if name in self.usage_stats:
+                    for field in ("calls", "failures", "raced"):
+                        self.usage_stats[name][field] += int(saved.get(field, 0))
+            
+            # Cooldowns are saved as wall-clock expiry times
+            offset = time.monotonic() - time.time()
+            for name, until in state.get("cooldown_until", {}).items():
+                if until > time.time():
+                    self._cooldown_until[name] = until + offset
+            
+            # A streak only matters while its cooldown is running; once that
+            # has expired the provider starts again from a clean slate
+            for name, streak in state.get("failure_streak", {}).items():
+                if name in self._cooldown_until:
+                    self._failure_streak[name] = int(streak)
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+    
+    def _save_state(self):
+        """Write usage counts and cooldowns atomically; best effort"""
+        offset = time.time() - time.monotonic()
+        with self._state_lock:
+            state = {
+                "usage_stats": {
+                    name: dict(stats) for name, stats in self.usage_stats.items()
+                },
+                "cooldown_until": {
+                    name: until + offset for name, until in self._cooldown_until.items()
+                },
+                "failure_streak": dict(self._failure_streak)
+            }
+        
+        write_json_atomic(MANAGER_STATE_PATH, state)
+    
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics"""
         return self.usage_stats
@@ -212,7 +410,8 @@ class LLMManager:
             total = stats["calls"]
             failures = stats["failures"]
             success_rate = ((total - failures) / total * 100) if total > 0 else 0
-            print(f"{provider.upper()}: {total} calls | {failures} failures | {success_rate:.1f}% success")
+            print(f"{provider.upper()}: {total} calls | {failures} failures | "
+                  f"{stats['raced']} raced | {success_rate:.1f}% success")
         print("=" * 50)
 
 # Singleton instance
@@ -223,4 +422,14 @@ def get_llm_manager() -> LLMManager:
     global _llm_manager
     if _llm_manager is None:
         _llm_manager = LLMManager()
-    return _llm_manager
\ No newline at end of file
+        _llm_manager._load_state()
+    return _llm_manager
+
+
+def _save_shared_state():
+    """Persist the shared manager's state once at interpreter exit"""
+    if _llm_manager is not None:
+        _llm_manager._save_state()
+
+
+atexit.register(_save_shared_state)
@@ -3,15 +3,71 @@ Metrics Collection and Tracking
 Updated for Free LLM Stack (Gemini, Groq, Ollama)
 """
 
+import os
 import time
 import json
+import atexit
+import threading
+from collections import deque
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional
+from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
 
-@dataclass
+
+# Created on first write rather than by every collector/session instance
+METRICS_DIR = Path("metrics")
+
+_RULE = "=" * 70
+_THIN_RULE = "-" * 70
+
+
+def _dump_line(data: Dict) -> bytes:
+    """Serialize one metrics record as a UTF-8 JSON line"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str) + b'\n'
+    return (json.dumps(data, default=str) + '\n').encode('utf-8')
+
+
+# Open JSONL handles shared by every collector in the process, by path
+_metrics_files = {}
+_metrics_files_lock = threading.Lock()
+
+
+def _append_line(path: Path, payload: bytes):
+    """Append one serialized record, opening the file on first use"""
+    with _metrics_files_lock:
+        fh = _metrics_files.get(path)
+        
+        # Reopen if the file was deleted or rotated away since the last write
+        if fh is not None and os.fstat(fh.fileno()).st_nlink == 0:
+            fh.close()
+            fh = None
+        
+        if fh is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fh = _metrics_files[path] = open(path, 'ab', buffering=64 * 1024)
+            atexit.register(fh.close)
+        
+        # Flushed so session reports see the record right away
+        fh.write(payload)
+        fh.flush()
+
+
+def _load_line(line):
+    """Parse one metrics record"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+@dataclass(slots=True)
 class AgentMetrics:
     """Metrics for a single agent execution"""
     agent_name: str
@@ -22,9 +78,22 @@ class AgentMetrics:
     llm_provider: str = "unknown"  # gemini, groq, or ollama
     tokens_used: int = 0  # Estimated, not all providers report this
     error: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """Plain dict in field order (cheaper than dataclasses.asdict)"""
+        return {
+            "agent_name": self.agent_name,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "success": self.success,
+            "llm_provider": self.llm_provider,
+            "tokens_used": self.tokens_used,
+            "error": self.error
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationMetrics:
     """Metrics for complete content generation"""
     topic: str
@@ -35,6 +104,19 @@ class GenerationMetrics:
     estimated_cost: float  # Always $0 for free providers!
     success: bool
     timestamp: str
+    
+    def to_dict(self) -> Dict:
+        """Plain dict in field order (cheaper than dataclasses.asdict)"""
+        return {
+            "topic": self.topic,
+            "total_duration": self.total_duration,
+            "agent_metrics": [m.to_dict() for m in self.agent_metrics],
+            "total_tokens": self.total_tokens,
+            "llm_providers_used": self.llm_providers_used,
+            "estimated_cost": self.estimated_cost,
+            "success": self.success,
+            "timestamp": self.timestamp
+        }
 
 
 class MetricsCollector:
@@ -43,13 +125,25 @@ class MetricsCollector:
     def __init__(self):
         self.agent_metrics: List[AgentMetrics] = []
         self.start_time: Optional[float] = None
-        self.metrics_dir = Path("metrics")
-        self.metrics_dir.mkdir(exist_ok=True)
+        # Durations are measured against perf_counter; start_time stays a
+        # wall-clock timestamp because it is saved with the metrics
+        self._start_counter: Optional[float] = None
+        self._reset_totals()
+        self.metrics_dir = METRICS_DIR
         
     def start_generation(self):
         """Mark start of content generation"""
         self.start_time = time.time()
+        self._start_counter = time.perf_counter()
         self.agent_metrics = []
+        self._reset_totals()
+    
+    def _reset_totals(self):
+        """Running aggregates over agent_metrics, updated by track_agent"""
+        self._provider_counts: Dict[str, int] = {}
+        self._successful = 0
+        self._total_tokens = 0
+        self._total_duration = 0
     
     def track_agent(self, agent_name: str, success: bool, 
                    llm_provider: str = "unknown", tokens: int = 0, error: str = None):
@@ -70,13 +164,19 @@ class MetricsCollector:
             agent_name=agent_name,
             start_time=start,
             end_time=end_time,
-            duration=end_time - start,
+            duration=self._elapsed(),
             success=success,
             llm_provider=llm_provider.lower(),
             tokens_used=tokens,
             error=error
         )
         self.agent_metrics.append(metric)
+        
+        self._provider_counts[metric.llm_provider] = self._provider_counts.get(metric.llm_provider, 0) + 1
+        if success:
+            self._successful += 1
+        self._total_tokens += tokens
+        self._total_duration += metric.duration
     
     def finalize(self, topic: str, success: bool) -> GenerationMetrics:
         """
@@ -89,14 +189,7 @@ class MetricsCollector:
         Returns:
             Complete metrics report
         """
-        total_duration = time.time() - (self.start_time or time.time())
-        total_tokens = sum(m.tokens_used for m in self.agent_metrics)
-        
-        # Count provider usage
-        provider_usage = {}
-        for metric in self.agent_metrics:
-            provider = metric.llm_provider
-            provider_usage[provider] = provider_usage.get(provider, 0) + 1
+        total_duration = self._elapsed()
         
         # Cost is ALWAYS $0 for free LLM providers!
         estimated_cost = 0.0
@@ -105,8 +198,8 @@ class MetricsCollector:
             topic=topic,
             total_duration=total_duration,
             agent_metrics=self.agent_metrics,
-            total_tokens=total_tokens,
-            llm_providers_used=provider_usage,
+            total_tokens=self._total_tokens,
+            llm_providers_used=dict(self._provider_counts),
             estimated_cost=estimated_cost,
             success=success,
             timestamp=datetime.now().isoformat()
@@ -115,59 +208,51 @@ class MetricsCollector:
         self.save_metrics(metrics)
         return metrics
     
+    def _elapsed(self) -> float:
+        """Seconds since start_generation, or 0 if it was never called"""
+        if self._start_counter is None:
+            return 0.0
+        return time.perf_counter() - self._start_counter
+    
     def save_metrics(self, metrics: GenerationMetrics):
         """Save metrics to file"""
-        metrics_file = self.metrics_dir / 'generation_metrics.jsonl'
-        
-        with open(metrics_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(asdict(metrics), default=str) + '\n')
+        _append_line(self.metrics_dir / 'generation_metrics.jsonl', _dump_line(metrics.to_dict()))
     
     def generate_report(self) -> str:
         """Generate human-readable report"""
         if not self.agent_metrics:
             return "No metrics collected"
         
-        report = "\n" + "="*70 + "\n"
-        report += "PERFORMANCE METRICS REPORT\n"
-        report += "="*70 + "\n\n"
+        parts = [f"\n{_RULE}\nPERFORMANCE METRICS REPORT\n{_RULE}\n\n"]
         
         # Individual agent metrics
         for metric in self.agent_metrics:
             status = "✅ SUCCESS" if metric.success else "❌ FAILED"
-            report += f"{metric.agent_name}:\n"
-            report += f"  Duration: {metric.duration:.2f}s\n"
-            report += f"  LLM Provider: {metric.llm_provider.upper()}\n"
-            if metric.tokens_used > 0:
-                report += f"  Tokens: ~{metric.tokens_used}\n"
-            report += f"  Status: {status}\n"
-            if metric.error:
-                report += f"  Error: {metric.error}\n"
-            report += "\n"
-        
-        # Calculate totals
-        total_duration = sum(m.duration for m in self.agent_metrics)
-        total_tokens = sum(m.tokens_used for m in self.agent_metrics)
-        
-        # Provider usage breakdown
-        provider_counts = {}
-        for metric in self.agent_metrics:
-            provider = metric.llm_provider
-            provider_counts[provider] = provider_counts.get(provider, 0) + 1
+            tokens_line = f"  Tokens: ~{metric.tokens_used}\n" if metric.tokens_used > 0 else ""
+            error_line = f"  Error: {metric.error}\n" if metric.error else ""
+            
+            # Whole row in one f-string: a single string build per agent
+            parts.append(
+                f"{metric.agent_name}:\n"
+                f"  Duration: {metric.duration:.2f}s\n"
+                f"  LLM Provider: {metric.llm_provider.upper()}\n"
+                f"{tokens_line}"
+                f"  Status: {status}\n"
+                f"{error_line}\n"
+            )
         
-        report += "-"*70 + "\n"
-        report += "TOTALS:\n"
-        report += f"  Total Duration: {total_duration:.2f}s\n"
-        if total_tokens > 0:
-            report += f"  Total Tokens: ~{total_tokens}\n"
+        parts.append(f"{_THIN_RULE}\nTOTALS:\n")
+        parts.append(f"  Total Duration: {self._total_duration:.2f}s\n")
+        if self._total_tokens > 0:
+            parts.append(f"  Total Tokens: ~{self._total_tokens}\n")
         
-        report += f"\n  LLM Provider Usage:\n"
-        for provider, count in provider_counts.items():
-            report += f"    {provider.upper()}: {count} calls\n"
+        parts.append("\n  LLM Provider Usage:\n")
+        for provider, count in self._provider_counts.items():
+            parts.append(f"    {provider.upper()}: {count} calls\n")
         
-        report += f"\n  💰 Total Cost: $0.00 (FREE!)\n"
-        report += "="*70 + "\n"
+        parts.append(f"\n  💰 Total Cost: $0.00 (FREE!)\n{_RULE}\n")
         
-        return report
+        return "".join(parts)
     
     def get_summary_stats(self) -> Dict:
         """Get summary statistics"""
@@ -183,12 +268,12 @@ class MetricsCollector:
         
         return {
             "total_agents": len(self.agent_metrics),
-            "successful_agents": sum(1 for m in self.agent_metrics if m.success),
-            "failed_agents": sum(1 for m in self.agent_metrics if not m.success),
-            "total_duration": sum(m.duration for m in self.agent_metrics),
-            "total_tokens": sum(m.tokens_used for m in self.agent_metrics),
+            "successful_agents": self._successful,
+            "failed_agents": len(self.agent_metrics) - self._successful,
+            "total_duration": self._total_duration,
+            "total_tokens": self._total_tokens,
             "cost": 0.0,  # Always free!
-            "providers_used": {m.llm_provider for m in self.agent_metrics}
+            "providers_used": set(self._provider_counts)
         }
 
 
@@ -196,60 +281,79 @@ class SessionMetrics:
     """Track metrics across multiple generation sessions"""
     
     def __init__(self):
-        self.metrics_dir = Path("metrics")
-        self.metrics_dir.mkdir(exist_ok=True)
+        self.metrics_dir = METRICS_DIR
+    
+    def iter_all_metrics(self) -> Iterator[Dict]:
+        """Yield saved metrics one record at a time, oldest first"""
+        metrics_file = self.metrics_dir / 'generation_metrics.jsonl'
+        
+        if not metrics_file.exists():
+            return
+        
+        with open(metrics_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    # Records stay plain dicts (simplified)
+                    yield _load_line(line)
     
     def load_all_metrics(self) -> List[GenerationMetrics]:
         """Load all saved metrics"""
+        return list(self.iter_all_metrics())
+    
+    def load_recent_metrics(self, last_n: int) -> List[Dict]:
+        """
+        Load only the last N saved metrics. Raw lines are kept in a bounded
+        deque and only those N are parsed, so memory and JSON work stay
+        O(last_n) however long the history file grows.
+        """
         metrics_file = self.metrics_dir / 'generation_metrics.jsonl'
         
         if not metrics_file.exists():
             return []
         
-        metrics_list = []
         with open(metrics_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    # Reconstruct dataclass (simplified)
-                    metrics_list.append(data)
+            lines = deque((line for line in f if line.strip()), maxlen=last_n)
         
-        return metrics_list
+        return [_load_line(line) for line in lines]
     
     def generate_session_report(self, last_n: int = 10) -> str:
         """Generate report for last N sessions"""
-        all_metrics = self.load_all_metrics()
+        if last_n > 0:
+            recent = self.load_recent_metrics(last_n)
+        else:
+            recent = self.load_all_metrics()
         
-        if not all_metrics:
+        if not recent:
             return "No metrics available"
         
-        recent = all_metrics[-last_n:] if len(all_metrics) > last_n else all_metrics
-        
-        report = "\n" + "="*70 + "\n"
-        report += f"SESSION REPORT (Last {len(recent)} generations)\n"
-        report += "="*70 + "\n\n"
-        
         total_duration = sum(m['total_duration'] for m in recent)
         total_tokens = sum(m['total_tokens'] for m in recent)
         successful = sum(1 for m in recent if m['success'])
         
-        report += f"Total Generations: {len(recent)}\n"
-        report += f"Successful: {successful} ({successful/len(recent)*100:.1f}%)\n"
-        report += f"Failed: {len(recent) - successful}\n"
-        report += f"Average Duration: {total_duration/len(recent):.2f}s\n"
-        report += f"Total Tokens: ~{total_tokens}\n"
-        report += f"💰 Total Cost: $0.00 (100% FREE!)\n"
-        report += "="*70 + "\n"
-        
-        return report
+        return (
+            f"\n{_RULE}\n"
+            f"SESSION REPORT (Last {len(recent)} generations)\n"
+            f"{_RULE}\n\n"
+            f"Total Generations: {len(recent)}\n"
+            f"Successful: {successful} ({successful/len(recent)*100:.1f}%)\n"
+            f"Failed: {len(recent) - successful}\n"
+            f"Average Duration: {total_duration/len(recent):.2f}s\n"
+            f"Total Tokens: ~{total_tokens}\n"
+            f"💰 Total Cost: $0.00 (100% FREE!)\n"
+            f"{_RULE}\n"
+        )
 
 
-# Create global collector instance
-_metrics_collector = None
+# One collector per thread / async task, so concurrent generations don't
+# share agent_metrics or start times
+_metrics_collector: ContextVar[Optional[MetricsCollector]] = ContextVar(
+    "metrics_collector", default=None
+)
 
 def get_metrics_collector() -> MetricsCollector:
-    """Get or create metrics collector singleton"""
-    global _metrics_collector
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
\ No newline at end of file
+    """Get or create the metrics collector for the current context"""
+    collector = _metrics_collector.get()
+    if collector is None:
+        collector = MetricsCollector()
+        _metrics_collector.set(collector)
+    return collector
\ No newline at end of file
@@ -25,12 +25,12 @@ class ContentProgressTracker:
     
     def start_tracking(self):
         """Start overall tracking"""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
     
     def start_stage(self, stage_name):
         """Start a stage - just print, don't update table"""
         self.current_stage = stage_name
-        self.stage_start = time.time()
+        self.stage_start = time.perf_counter()
         self.stages[stage_name]['status'] = 'working'
         
         # Simple print instead of table update
@@ -40,7 +40,7 @@ class ContentProgressTracker:
     def complete_stage(self, stage_name):
         """Complete a stage"""
         if self.stage_start:
-            elapsed = time.time() - self.stage_start
+            elapsed = time.perf_counter() - self.stage_start
             self.stages[stage_name]['time'] = elapsed
         
         self.stages[stage_name]['status'] = 'done'
@@ -52,7 +52,7 @@ class ContentProgressTracker:
     
     def get_completion_summary(self):
         """Get final summary - ONE table at the end"""
-        total_time = time.time() - self.start_time if self.start_time else 0
+        total_time = time.perf_counter() - self.start_time if self.start_time else 0
         
         table = Table(title="[cyan]Generation Complete[/cyan]", show_header=True)
         table.add_column("Stage", style="cyan")
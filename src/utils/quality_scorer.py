@@ -10,6 +10,14 @@ import re
 
 console = Console()
 
+_BULLET_RE = re.compile(r'^\s*[-*]\s', re.MULTILINE)
+_NUMBERED_RE = re.compile(r'^\s*\d+\.\s', re.MULTILINE)
+_HEADER_RE = re.compile(r'^#{1,3}\s+(.+)$', re.MULTILINE)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+_CONCLUSION_KEYWORDS = ('conclusion', 'final thoughts', 'in summary',
+                        'to sum up', 'in closing', 'takeaway')
+
 
 class ContentQualityScorer:
     """Evaluate content quality across multiple dimensions"""
@@ -31,17 +39,20 @@ class ContentQualityScorer:
             Dictionary with scores and analysis
         """
         
+        # Scan the content once; every evaluator reads from these features
+        features = self._extract_features(content)
+        
         # 1. Structure Score (25 points)
-        structure_score = self._evaluate_structure(content)
+        structure_score = self._evaluate_structure(features)
         
         # 2. Completeness Score (25 points)
-        completeness_score = self._evaluate_completeness(content, target_word_count)
+        completeness_score = self._evaluate_completeness(features, target_word_count)
         
         # 3. Readability Score (25 points)
-        readability_score = self._evaluate_readability(content)
+        readability_score = self._evaluate_readability(features)
         
         # 4. SEO Score (25 points)
-        seo_score = self._evaluate_seo(content, keywords)
+        seo_score = self._evaluate_seo(features, keywords)
         
         # Calculate overall score
         overall_score = (
@@ -62,25 +73,42 @@ class ContentQualityScorer:
             'readability_score': readability_score,
             'seo_score': seo_score,
             'details': {
-                'word_count': len(content.split()),
+                'word_count': features['word_count'],
                 'target_word_count': target_word_count,
-                'has_title': content.strip().startswith('#'),
-                'header_count': content.count('##'),
-                'has_conclusion': self._has_conclusion(content)
+                'has_title': features['has_title'],
+                'header_count': features['h2_count'],
+                'has_conclusion': features['has_conclusion']
             }
         }
     
-    def _evaluate_structure(self, content: str) -> int:
+    def _extract_features(self, content: str) -> dict:
+        """Compute the splits, counts and flags shared by the evaluators"""
+        
+        content_lower = content.lower()
+        
+        return {
+            'content': content,
+            'content_lower': content_lower,
+            'word_count': len(content.split()),
+            'paragraphs': content.split('\n\n'),
+            'has_title': content.strip().startswith('#'),
+            'h2_count': content.count('##'),
+            'has_lists': bool(_BULLET_RE.search(content)),
+            'has_numbered': bool(_NUMBERED_RE.search(content)),
+            'has_conclusion': self._has_conclusion(content_lower)
+        }
+    
+    def _evaluate_structure(self, features: dict) -> int:
         """Evaluate content structure (0-100)"""
         
         score = 0
         
         # Has H1 title (20 points)
-        if content.strip().startswith('#'):
+        if features['has_title']:
             score += 20
         
         # Has H2 subheaders (30 points)
-        h2_count = content.count('##')
+        h2_count = features['h2_count']
         if h2_count >= 5:
             score += 30
         elif h2_count >= 3:
@@ -89,17 +117,15 @@ class ContentQualityScorer:
             score += 15
         
         # Has lists or formatting (20 points)
-        has_lists = bool(re.search(r'^\s*[-*]\s', content, re.MULTILINE))
-        has_numbered = bool(re.search(r'^\s*\d+\.\s', content, re.MULTILINE))
-        if has_lists or has_numbered:
+        if features['has_lists'] or features['has_numbered']:
             score += 20
         
         # Has conclusion (15 points)
-        if self._has_conclusion(content):
+        if features['has_conclusion']:
             score += 15
         
         # Logical paragraphs (15 points)
-        paragraphs = content.split('\n\n')
+        paragraphs = features['paragraphs']
         if len(paragraphs) >= 5:
             score += 15
         elif len(paragraphs) >= 3:
@@ -107,10 +133,10 @@ class ContentQualityScorer:
         
         return min(score, 100)
     
-    def _evaluate_completeness(self, content: str, target: int) -> int:
+    def _evaluate_completeness(self, features: dict, target: int) -> int:
         """Evaluate completeness (0-100)"""
         
-        word_count = len(content.split())
+        word_count = features['word_count']
         
         # Word count accuracy (50 points)
         percentage = (word_count / target) if target > 0 else 0
@@ -122,27 +148,28 @@ class ContentQualityScorer:
             word_score = 20
         
         # Has introduction (25 points)
-        first_paragraph = content.split('\n\n')[1] if '\n\n' in content else ""
+        paragraphs = features['paragraphs']
+        first_paragraph = paragraphs[1] if len(paragraphs) > 1 else ""
         has_intro = len(first_paragraph.split()) > 50
         intro_score = 25 if has_intro else 10
         
         # Has conclusion (25 points)
-        conclusion_score = 25 if self._has_conclusion(content) else 10
+        conclusion_score = 25 if features['has_conclusion'] else 10
         
         return word_score + intro_score + conclusion_score
     
-    def _evaluate_readability(self, content: str) -> int:
+    def _evaluate_readability(self, features: dict) -> int:
         """Evaluate readability (0-100)"""
         
         score = 0
+        content = features['content']
         
         # Average sentence length
-        sentences = re.split(r'[.!?]+', content)
+        sentences = _SENTENCE_SPLIT_RE.split(content)
         sentences = [s.strip() for s in sentences if s.strip()]
         
         if sentences:
-            words = content.split()
-            avg_sentence_length = len(words) / len(sentences)
+            avg_sentence_length = features['word_count'] / len(sentences)
             
             # Optimal: 15-25 words per sentence (40 points)
             if 15 <= avg_sentence_length <= 25:
@@ -153,7 +180,7 @@ class ContentQualityScorer:
                 score += 20
         
         # Paragraph length (30 points)
-        paragraphs = [p for p in content.split('\n\n') if p.strip() and not p.strip().startswith('#')]
+        paragraphs = [p for p in features['paragraphs'] if p.strip() and not p.strip().startswith('#')]
         if paragraphs:
             avg_para_length = sum(len(p.split()) for p in paragraphs) / len(paragraphs)
             
@@ -167,8 +194,8 @@ class ContentQualityScorer:
         
         # Uses formatting (30 points)
         has_bold = '**' in content or '<strong>' in content
-        has_lists = bool(re.search(r'^\s*[-*]\s', content, re.MULTILINE))
-        has_headers = '##' in content
+        has_lists = features['has_lists']
+        has_headers = features['h2_count'] > 0
         
         formatting_score = sum([
             10 if has_bold else 0,
@@ -179,14 +206,16 @@ class ContentQualityScorer:
         
         return min(score, 100)
     
-    def _evaluate_seo(self, content: str, keywords: list = None) -> int:
+    def _evaluate_seo(self, features: dict, keywords: list = None) -> int:
         """Evaluate SEO optimization (0-100)"""
         
         score = 0
-        content_lower = content.lower()
+        content = features['content']
+        content_lower = features['content_lower']
         
         # Has meta information in content (20 points)
-        has_meta_title = 'meta title' in content_lower or '**meta title' in content_lower
+        # Also covers the bold '**meta title' form
+        has_meta_title = 'meta title' in content_lower
         has_meta_desc = 'meta description' in content_lower
         if has_meta_title:
             score += 10
@@ -202,7 +231,7 @@ class ContentQualityScorer:
             score += 20  # Partial credit if no keywords specified
         
         # Header optimization (25 points)
-        headers = re.findall(r'^#{1,3}\s+(.+)$', content, re.MULTILINE)
+        headers = _HEADER_RE.findall(content)
         if len(headers) >= 4:
             score += 25
         elif len(headers) >= 2:
@@ -222,17 +251,13 @@ class ContentQualityScorer:
         
         return min(score, 100)
     
-    def _has_conclusion(self, content: str) -> bool:
-        """Check if content has a conclusion section"""
-        
-        conclusion_keywords = ['conclusion', 'final thoughts', 'in summary', 
-                              'to sum up', 'in closing', 'takeaway']
+    def _has_conclusion(self, content_lower: str) -> bool:
+        """Check if (already lower-cased) content has a conclusion section"""
         
         # Check last 30% of content
-        content_lower = content.lower()
         last_section = content_lower[-len(content_lower)//3:]
         
-        return any(keyword in last_section for keyword in conclusion_keywords)
+        return any(keyword in last_section for keyword in _CONCLUSION_KEYWORDS)
     
     def _get_grade(self, score: float) -> str:
         """Convert score to letter grade"""
@@ -0,0 +1,22 @@
+"""
+Readability Helpers
+Memoized textstat scores shared by the SEO optimizer and tone analyzer
+"""
+
+from functools import lru_cache
+import textstat
+
+
+@lru_cache(maxsize=128)
+def flesch_scores(text: str) -> tuple:
+    """
+    Flesch reading ease and Flesch-Kincaid grade for normalised text.
+    Both tools score the same drafts, so one cache serves them both.
+    """
+    return textstat.flesch_reading_ease(text), textstat.flesch_kincaid_grade(text)
+
+
+@lru_cache(maxsize=128)
+def difficult_words(text: str) -> int:
+    """Number of difficult words in normalised text"""
+    return textstat.difficult_words(text)